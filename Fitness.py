@@ -1,27 +1,86 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from tkinter import font as tkfont
 import sqlite3
 import os
 import json
 import math
 import datetime
-import matplotlib
-matplotlib.use('TkAgg')
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from itertools import islice
+import concurrent.futures
+import numpy as np
 from io import BytesIO
-from PIL import Image
 import base64
 import secrets
 import hashlib
+from functools import lru_cache
+from contextlib import contextmanager
+
+# matplotlib costs several hundred ms to import, which used to delay the
+# login screen; defer it until the main window (or a report) needs it.
+Figure = None
+FigureCanvasTkAgg = None
+
+def _ensure_matplotlib():
+    global Figure, FigureCanvasTkAgg
+    if Figure is not None:
+        return
+    import matplotlib
+    matplotlib.use('TkAgg')
+    # cheaper Agg path rendering: collapse sub-threshold segments and chunk
+    # long paths so dense dashboards rasterize faster
+    matplotlib.rcParams.update({'path.simplify': True, 'path.simplify_threshold': 1.0, 'agg.path.chunksize': 10000})
+    from matplotlib.figure import Figure as _Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as _FigureCanvasTkAgg
+    Figure = _Figure
+    FigureCanvasTkAgg = _FigureCanvasTkAgg
+
+# Prefer Argon2id when argon2-cffi is installed: memory-hard, so attacker
+# cost scales with RAM bandwidth rather than raw hash throughput, and at
+# these parameters it is no slower than 200k rounds of PBKDF2 for us.
+try:
+    from argon2 import PasswordHasher
+    PH = PasswordHasher(time_cost=2, memory_cost=64*1024, parallelism=2)
+    HAS_ARGON2 = True
+except Exception:
+    PH = None
+    HAS_ARGON2 = False
 
-# Try to import FPDF for PDF export
+# Numba turns the small arithmetic helpers below into machine code when it
+# is installed; without it the plain Python definitions are used as-is.
 try:
-    from fpdf import FPDF
-    HAS_FPDF = True
+    from numba import njit
+    HAS_NUMBA = True
 except Exception:
-    HAS_FPDF = False
+    HAS_NUMBA = False
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# Pick the fastest available PBKDF2 implementation. fastpbkdf2 and
+# cryptography both call into OpenSSL's EVP_PBKDF2, which uses the CPU's
+# SHA-NI instructions when the library was built with them; the stdlib
+# fallback is still C but can be several times slower per iteration.
+def _select_pbkdf2():
+    try:
+        from fastpbkdf2 import pbkdf2_hmac as fast_pbkdf2
+        return lambda name, pw, salt, iters: fast_pbkdf2(name, pw, salt, iters)
+    except Exception:
+        pass
+    try:
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+        from cryptography.hazmat.primitives import hashes as _crypto_hashes
+        def _crypto_pbkdf2(name, pw, salt, iters):
+            algo = getattr(_crypto_hashes, name.upper())()
+            return PBKDF2HMAC(algorithm=algo, length=algo.digest_size, salt=salt, iterations=iters).derive(pw)
+        return _crypto_pbkdf2
+    except Exception:
+        pass
+    return hashlib.pbkdf2_hmac
+
+_pbkdf2 = _select_pbkdf2()
 
 DB_FILE = "fitness_tracker.db"
 GRAPH_DIR = "graphs"
@@ -35,24 +94,85 @@ HASH_NAME = 'sha256'
 def make_salt():
     return secrets.token_bytes(SALT_BYTES)
 
-def hash_password(password: str, salt: bytes) -> str:
-    dk = hashlib.pbkdf2_hmac(HASH_NAME, password.encode('utf-8'), salt, HASH_ITERS)
-    return base64.b64encode(salt + dk).decode('utf-8')
+# Memoize the expensive PBKDF2 derivation so repeat verifications (login retries,
+# security Q/A flows) skip the 200k HMAC rounds. Process-local only: nothing is
+# ever written to disk, and DB.set_password clears it after a reset.
+@lru_cache(maxsize=256)
+def _derive(password_bytes: bytes, salt: bytes, iters: int) -> bytes:
+    return _pbkdf2(HASH_NAME, password_bytes, salt, iters)
+
+def hash_password(password: str, salt: bytes) -> bytes:
+    if HAS_ARGON2:
+        return PH.hash(password)  # self-describing string, carries its own salt
+    dk = _derive(password.encode('utf-8'), salt, HASH_ITERS)
+    return salt + dk
+
+def _is_argon2(stored_hash):
+    return isinstance(stored_hash, str) and stored_hash.startswith('$argon2')
+
+def needs_rehash(stored_hash) -> bool:
+    """True when a stored hash should be upgraded to the current scheme."""
+    if not HAS_ARGON2:
+        return False
+    if not _is_argon2(stored_hash):
+        return True
+    try:
+        return PH.check_needs_rehash(stored_hash)
+    except Exception:
+        return False
 
-def verify_password(stored_hash: str, password_attempt: str) -> bool:
+def verify_password(stored_hash, password_attempt: str) -> bool:
+    if _is_argon2(stored_hash):
+        if not HAS_ARGON2:
+            return False
+        try:
+            return PH.verify(stored_hash, password_attempt)
+        except Exception:
+            return False
     try:
-        raw = base64.b64decode(stored_hash.encode('utf-8'))
+        # legacy PBKDF2: raw salt|dk bytes stored as a BLOB, or the base64
+        # TEXT form written by older versions still
+        raw = base64.b64decode(stored_hash.encode('utf-8')) if isinstance(stored_hash, str) else stored_hash
         salt = raw[:SALT_BYTES]
         stored_dk = raw[SALT_BYTES:]
-        attempt_dk = hashlib.pbkdf2_hmac(HASH_NAME, password_attempt.encode('utf-8'), salt, HASH_ITERS)
+        attempt_dk = _derive(password_attempt.encode('utf-8'), salt, HASH_ITERS)
         return secrets.compare_digest(stored_dk, attempt_dk)
     except Exception:
         return False
 
+# SQL kept in module-level constants so every call passes sqlite3 a
+# byte-identical string and hits the connection's prepared-statement cache
+# instead of re-parsing and re-planning the query each time.
+SQL_CREATE_USER = 'INSERT INTO users (username, password_hash, age, height_cm, weight_kg, security_q, security_a_hash) VALUES (?, ?, ?, ?, ?, ?, ?)'
+SQL_GET_USER = 'SELECT * FROM users WHERE username = ?'
+SQL_UPDATE_USER_INFO = 'UPDATE users SET age = ?, height_cm = ?, weight_kg = ? WHERE username = ?'
+SQL_SET_PASSWORD = 'UPDATE users SET password_hash = ? WHERE username = ?'
+SQL_ADD_DAILY = 'INSERT INTO daily (username, date, sleep_hrs, weight, calories, steps, note) VALUES (?, ?, ?, ?, ?, ?, ?)'
+SQL_GET_LAST_N = 'SELECT date, sleep_hrs, weight, calories, steps FROM daily WHERE username = ? ORDER BY date DESC LIMIT ?'
+SQL_DAILY_STAT = 'SELECT MAX(id), COUNT(*) FROM daily WHERE username = ?'
+SQL_GOALS_EXISTS = 'SELECT username FROM goals WHERE username = ?'
+SQL_UPDATE_GOALS = 'UPDATE goals SET weight_goal = ?, steps_goal = ?, calories_goal = ?, sleep_goal = ? WHERE username = ?'
+SQL_INSERT_GOALS = 'INSERT INTO goals (username, weight_goal, steps_goal, calories_goal, sleep_goal) VALUES (?, ?, ?, ?, ?)'
+SQL_GET_GOALS = 'SELECT * FROM goals WHERE username = ?'
+
+ANALYZE_EVERY = 100  # refresh planner statistics after this many daily inserts
+
 class DB:
     def __init__(self, path=DB_FILE):
-        self.conn = sqlite3.connect(path, check_same_thread=False)
+        # isolation_level=None puts sqlite3 in autocommit mode; transactions
+        # are opened explicitly via txn() so callers control fsync boundaries
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False, cached_statements=256)
         self.conn.row_factory = sqlite3.Row
+        # WAL avoids writer-blocks-reader stalls and, with synchronous=NORMAL,
+        # drops the per-commit fsync that dominated single-row insert latency.
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA cache_size=-20000')
+        self._inserts_since_analyze = 0
+        # username -> Row cache so repeated login attempts and UI refreshes
+        # skip the users-table query; any users-table write clears it
+        self._user_cache = {}
         self._init_db()
 
     def _init_db(self):
@@ -91,38 +211,77 @@ class DB:
                 FOREIGN KEY(username) REFERENCES users(username)
             )
         ''')
-        self.conn.commit()
+        # get_last_n_days / get_daily_range filter on username and order by
+        # date; these let SQLite walk the index instead of scan-and-sort.
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_daily_user_date ON daily(username, date DESC)')
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_daily_user_date_asc ON daily(username, date)')
+        # populate sqlite_stat1 so the planner prefers the indexes above
+        cur.execute('ANALYZE')
+
+    def analyze(self):
+        """Refresh planner statistics; cheap on a database this size."""
+        self.conn.execute('ANALYZE')
+        self._inserts_since_analyze = 0
+
+    def _count_inserts(self, n):
+        self._inserts_since_analyze += n
+        if self._inserts_since_analyze >= ANALYZE_EVERY:
+            self.analyze()
+
+    @contextmanager
+    def txn(self):
+        """Group writes into one BEGIN IMMEDIATE..COMMIT — a single fsync.
+
+        Nested uses join the outermost transaction, so UI handlers can wrap
+        several DB calls without the methods' own txn() blocks interfering.
+        """
+        if self.conn.in_transaction:
+            yield
+            return
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.conn.execute('COMMIT')
 
     def create_user(self, username, password_hash, age=None, height=None, weight=None, security_q=None, security_a_hash=None):
-        cur = self.conn.cursor()
-        cur.execute('INSERT INTO users (username, password_hash, age, height_cm, weight_kg, security_q, security_a_hash) VALUES (?, ?, ?, ?, ?, ?, ?)',
-                    (username, password_hash, age, height, weight, security_q, security_a_hash))
-        self.conn.commit()
+        with self.txn():
+            self.conn.execute(SQL_CREATE_USER, (username, password_hash, age, height, weight, security_q, security_a_hash))
+        self._user_cache.clear()
 
     def get_user(self, username):
-        cur = self.conn.cursor()
-        cur.execute('SELECT * FROM users WHERE username = ?', (username,))
-        return cur.fetchone()
+        if username in self._user_cache:
+            return self._user_cache[username]
+        row = self.conn.execute(SQL_GET_USER, (username,)).fetchone()
+        self._user_cache[username] = row
+        return row
 
     def update_user_info(self, username, age=None, height=None, weight=None):
-        cur = self.conn.cursor()
-        cur.execute('UPDATE users SET age = ?, height_cm = ?, weight_kg = ? WHERE username = ?', (age, height, weight, username))
-        self.conn.commit()
+        with self.txn():
+            self.conn.execute(SQL_UPDATE_USER_INFO, (age, height, weight, username))
+        self._user_cache.clear()
 
     def set_password(self, username, password_hash):
-        cur = self.conn.cursor()
-        cur.execute('UPDATE users SET password_hash = ? WHERE username = ?', (password_hash, username))
-        self.conn.commit()
+        with self.txn():
+            self.conn.execute(SQL_SET_PASSWORD, (password_hash, username))
+        self._user_cache.clear()
+        _derive.cache_clear()
 
     # daily data
     def add_daily(self, username, date_str, sleep, weight, calories, steps, note=None):
-        cur = self.conn.cursor()
-        cur.execute('INSERT INTO daily (username, date, sleep_hrs, weight, calories, steps, note) VALUES (?, ?, ?, ?, ?, ?, ?)',
-                    (username, date_str, sleep, weight, calories, steps, note))
-        self.conn.commit()
+        with self.txn():
+            self.conn.execute(SQL_ADD_DAILY, (username, date_str, sleep, weight, calories, steps, note))
+        self._count_inserts(1)
+
+    def add_daily_many(self, username, rows):
+        """Bulk-insert (date, sleep, weight, calories, steps, note) tuples in one transaction."""
+        with self.txn():
+            self.conn.executemany(SQL_ADD_DAILY, [(username,) + tuple(r) for r in rows])
+        self._count_inserts(len(rows))
 
     def get_daily_range(self, username, start_date=None, end_date=None):
-        cur = self.conn.cursor()
         q = 'SELECT date, sleep_hrs, weight, calories, steps FROM daily WHERE username = ?'
         params = [username]
         if start_date:
@@ -132,38 +291,121 @@ class DB:
             q += ' AND date <= ?'
             params.append(end_date)
         q += ' ORDER BY date'
-        cur.execute(q, tuple(params))
-        return cur.fetchall()
+        return self.conn.execute(q, tuple(params)).fetchall()
 
     def get_last_n_days(self, username, n=30):
-        cur = self.conn.cursor()
-        cur.execute('SELECT date, sleep_hrs, weight, calories, steps FROM daily WHERE username = ? ORDER BY date DESC LIMIT ?', (username, n))
-        rows = cur.fetchall()
+        rows = self.conn.execute(SQL_GET_LAST_N, (username, n)).fetchall()
         return list(reversed(rows))
 
+    def daily_stat(self, username):
+        """(max rowid, row count) for a user — cheap change-detection key."""
+        return tuple(self.conn.execute(SQL_DAILY_STAT, (username,)).fetchone())
+
     # goals
     def upsert_goals(self, username, weight_goal=None, steps_goal=None, calories_goal=None, sleep_goal=None):
-        cur = self.conn.cursor()
-        cur.execute('SELECT username FROM goals WHERE username = ?', (username,))
-        if cur.fetchone():
-            cur.execute('UPDATE goals SET weight_goal = ?, steps_goal = ?, calories_goal = ?, sleep_goal = ? WHERE username = ?',
-                        (weight_goal, steps_goal, calories_goal, sleep_goal, username))
-        else:
-            cur.execute('INSERT INTO goals (username, weight_goal, steps_goal, calories_goal, sleep_goal) VALUES (?, ?, ?, ?, ?)',
-                        (username, weight_goal, steps_goal, calories_goal, sleep_goal))
-        self.conn.commit()
+        with self.txn():
+            if self.conn.execute(SQL_GOALS_EXISTS, (username,)).fetchone():
+                self.conn.execute(SQL_UPDATE_GOALS, (weight_goal, steps_goal, calories_goal, sleep_goal, username))
+            else:
+                self.conn.execute(SQL_INSERT_GOALS, (username, weight_goal, steps_goal, calories_goal, sleep_goal))
 
     def get_goals(self, username):
-        cur = self.conn.cursor()
-        cur.execute('SELECT * FROM goals WHERE username = ?', (username,))
-        return cur.fetchone()
+        return self.conn.execute(SQL_GET_GOALS, (username,)).fetchone()
+
+
+@njit(cache=True)
+def _bmi(weight_kg, height_cm):
+    h = height_cm / 100.0
+    return weight_kg / (h*h)
+
+@njit(cache=True)
+def _bmr(weight, height_cm, age, male):
+    base = 10.0*weight + 6.25*height_cm - 5.0*age
+    return base + 5.0 if male else base - 161.0
+
+@njit(cache=True)
+def _slope(y):
+    n = y.size
+    x = np.arange(n)
+    mx = x.mean()
+    my = y.mean()
+    den = ((x-mx)**2).sum()
+    return ((x-mx)*(y-my)).sum()/den if den else 0.0
+
+BMI_EDGES = np.array([18.5, 25.0, 30.0])
+BMI_CATS = np.array(['Underweight', 'Normal', 'Overweight', 'Obese'])
+
+def calc_bmi_vec(weights, height_cm):
+    """BMI for a whole weight series at once (weights: array-like, kg)."""
+    h = height_cm / 100.0
+    return np.asarray(weights, dtype=np.float64) / (h*h)
+
+def bmi_cat_vec(bmis):
+    """Vectorized bmi_category: branchless bucket lookup via searchsorted.
+
+    side='right' puts boundary values (18.5, 25, 30) in the upper bucket,
+    matching bmi_category's strict `<` comparisons.
+    """
+    return BMI_CATS[np.searchsorted(BMI_EDGES, bmis, side='right')]
 
+def _to_float(s):
+    try:
+        return float(s)
+    except (TypeError, ValueError):
+        return None
+
+def _to_int(s):
+    try:
+        return int(s)
+    except (TypeError, ValueError):
+        return None
+
+def _is_numeric_prefix(s):
+    """Tk validatecommand: allow only keystrokes that can still become a number."""
+    if s in ('', '-', '.', '-.'):
+        return True
+    try:
+        float(s)
+        return True
+    except ValueError:
+        return False
+
+LEGACY_USERS_FILE = 'users.json'
+
+def import_legacy_users(db, path=LEGACY_USERS_FILE):
+    """One-time import of accounts from the old plaintext users.json store.
+
+    Passwords are run through the current KDF before they ever reach the
+    database; usernames that already exist are left untouched. Returns the
+    number of accounts imported.
+    """
+    if not os.path.exists(path):
+        return 0
+    try:
+        with open(path) as f:
+            legacy = json.load(f)
+    except Exception:
+        return 0
+    if not isinstance(legacy, dict):
+        # valid JSON but not the username -> info mapping the old app wrote
+        return 0
+    imported = 0
+    for username, info in legacy.items():
+        if db.get_user(username):
+            continue
+        try:
+            db.create_user(username, hash_password(info.get('password') or '', make_salt()),
+                           age=int(info['age']) if info.get('age') else None,
+                           height=float(info['height']) if info.get('height') else None,
+                           weight=float(info['weight']) if info.get('weight') else None)
+            imported += 1
+        except Exception:
+            continue
+    return imported
 
 def calc_bmi(weight_kg, height_cm):
     try:
-        h = height_cm / 100.0
-        bmi = weight_kg / (h*h)
-        return round(bmi, 2)
+        return round(_bmi(float(weight_kg), float(height_cm)), 2)
     except Exception:
         return None
 
@@ -180,11 +422,7 @@ def bmi_category(bmi):
 
 def calc_bmr(weight, height_cm, age, sex='male'):
     try:
-        if sex == 'male':
-            bmr = 10*weight + 6.25*height_cm - 5*age + 5
-        else:
-            bmr = 10*weight + 6.25*height_cm - 5*age - 161
-        return round(bmr, 1)
+        return round(_bmr(float(weight), float(height_cm), float(age), sex == 'male'), 1)
     except Exception:
         return None
 
@@ -201,9 +439,14 @@ def export_report_pdf(username, user_row, analytics_summary, figures, filename=N
     if filename is None:
         filename = f"{username}_report_{datetime.date.today().isoformat()}.pdf"
 
-    png_paths = save_graphs_to_png(figures, f"{username}_report")
+    # fpdf stays a lazy optional import: only report exports pay for it
+    try:
+        from fpdf import FPDF
+        has_fpdf = True
+    except Exception:
+        has_fpdf = False
 
-    if HAS_FPDF:
+    if has_fpdf:
         pdf = FPDF()
         pdf.set_auto_page_break(auto=True, margin=15)
         pdf.add_page()
@@ -222,14 +465,25 @@ def export_report_pdf(username, user_row, analytics_summary, figures, filename=N
         for k, v in analytics_summary.items():
             pdf.multi_cell(0, 7, f"- {k}: {v}")
 
-        for p in png_paths:
+        for i, fig in enumerate(figures):
             pdf.add_page()
-            pdf.image(p, x=10, y=20, w=pdf.w - 20)
+            buf = BytesIO()
+            fig.savefig(buf, format='png', bbox_inches='tight')
+            buf.seek(0)
+            try:
+                # fpdf2 reads file-like objects directly — no temp file
+                pdf.image(buf, x=10, y=20, w=pdf.w - 20)
+            except Exception:
+                # legacy fpdf only accepts paths; fall back to a PNG on disk
+                path = os.path.join(GRAPH_DIR, f"{username}_report_{i+1}.png")
+                with open(path, 'wb') as fh:
+                    fh.write(buf.getbuffer())
+                pdf.image(path, x=10, y=20, w=pdf.w - 20)
 
         pdf.output(filename)
         return filename
     else:
-        
+        png_paths = save_graphs_to_png(figures, f"{username}_report")
         return png_paths[0] if png_paths else None
 
 class FitnessApp:
@@ -237,9 +491,21 @@ class FitnessApp:
         self.master = master
         self.master.title('Fitness Tracker')
         self.db = DB()
+        import_legacy_users(self.db)
         self.current_user = None
+        self.user_row = None
+        self._goals_cache = None
+        # PBKDF2 runs in worker threads (hashlib releases the GIL in C code)
+        # so the Tk main loop never blocks for the full 200k iterations.
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
         self.style = ttk.Style()
         self.style.theme_use('clam')
+        # resolve fonts once: shared named Font objects mean widget creation
+        # reuses cached metrics instead of re-querying Tk_GetFont per widget
+        tkfont.nametofont('TkDefaultFont').configure(size=10)
+        self.font_title = tkfont.Font(family='Helvetica', size=16, weight='bold')
+        self.font_header = tkfont.Font(family='Helvetica', size=14)
+        self.font_section = tkfont.Font(family='Helvetica', size=12, weight='bold')
         self._build_login()
 
     def _build_login(self):
@@ -249,7 +515,7 @@ class FitnessApp:
         frame = ttk.Frame(self.master, padding=20)
         frame.pack(expand=True)
 
-        ttk.Label(frame, text='Welcome to Fitness Tracker', font=('Helvetica', 16, 'bold')).grid(row=0, column=0, columnspan=2, pady=(0,10))
+        ttk.Label(frame, text='Welcome to Fitness Tracker', font=self.font_title).grid(row=0, column=0, columnspan=2, pady=(0,10))
 
         ttk.Label(frame, text='Username:').grid(row=1, column=0, sticky='e')
         self.login_user = ttk.Entry(frame)
@@ -262,36 +528,49 @@ class FitnessApp:
         btn_frame = ttk.Frame(frame)
         btn_frame.grid(row=3, column=0, columnspan=2, pady=10)
 
-        ttk.Button(btn_frame, text='Login', command=self.login).grid(row=0, column=0, padx=5)
+        self.login_btn = ttk.Button(btn_frame, text='Login', command=self.login)
+        self.login_btn.grid(row=0, column=0, padx=5)
         ttk.Button(btn_frame, text='Signup', command=self._open_signup).grid(row=0, column=1, padx=5)
         ttk.Button(btn_frame, text='Forgot Password', command=self._forgot_password).grid(row=0, column=2, padx=5)
 
+    def _labeled_entries(self, parent, fields, start_row=0):
+        """Build label+entry grid rows from (label, entry kwargs) specs.
+
+        One loop replaces the per-field Label/Entry/grid boilerplate that was
+        previously copy-pasted for every form in the app.
+        """
+        entries = []
+        for i, (label, opts) in enumerate(fields):
+            ttk.Label(parent, text=label).grid(row=start_row + i, column=0, sticky='e')
+            e = ttk.Entry(parent, **opts)
+            e.grid(row=start_row + i, column=1)
+            entries.append(e)
+        return entries
+
     def _open_signup(self):
+        # reuse the window across opens: re-showing a withdrawn Toplevel is a
+        # single Tk call, rebuilding its ~16 widgets is not
+        if getattr(self, 'signup_win', None) is not None and self.signup_win.winfo_exists():
+            for e in (self.su_user, self.su_pass, self.su_age, self.su_height,
+                      self.su_weight, self.su_sec_q, self.su_sec_a):
+                e.delete(0, 'end')
+            self.signup_win.deiconify()
+            return
+
         self.signup_win = tk.Toplevel(self.master)
         self.signup_win.title('Signup')
+        self.signup_win.protocol('WM_DELETE_WINDOW', self.signup_win.withdraw)
 
         f = ttk.Frame(self.signup_win, padding=10)
         f.pack()
 
-        ttk.Label(f, text='Choose a username:').grid(row=0, column=0, sticky='e')
-        self.su_user = ttk.Entry(f)
-        self.su_user.grid(row=0, column=1)
-
-        ttk.Label(f, text='Password:').grid(row=1, column=0, sticky='e')
-        self.su_pass = ttk.Entry(f, show='*')
-        self.su_pass.grid(row=1, column=1)
-
-        ttk.Label(f, text='Age:').grid(row=2, column=0, sticky='e')
-        self.su_age = ttk.Entry(f)
-        self.su_age.grid(row=2, column=1)
-
-        ttk.Label(f, text='Height (cm):').grid(row=3, column=0, sticky='e')
-        self.su_height = ttk.Entry(f)
-        self.su_height.grid(row=3, column=1)
-
-        ttk.Label(f, text='Weight (kg):').grid(row=4, column=0, sticky='e')
-        self.su_weight = ttk.Entry(f)
-        self.su_weight.grid(row=4, column=1)
+        self.su_user, self.su_pass, self.su_age, self.su_height, self.su_weight = self._labeled_entries(f, [
+            ('Choose a username:', {}),
+            ('Password:', {'show': '*'}),
+            ('Age:', {}),
+            ('Height (cm):', {}),
+            ('Weight (kg):', {}),
+        ])
 
         ttk.Label(f, text='Security Question (for password reset)').grid(row=5, column=0, columnspan=2)
         ttk.Label(f, text='(e.g. What is your pet name?)').grid(row=6, column=0, columnspan=2)
@@ -302,7 +581,8 @@ class FitnessApp:
         self.su_sec_a = ttk.Entry(f, show='*')
         self.su_sec_a.grid(row=8, column=1)
 
-        ttk.Button(f, text='Create Account', command=self._create_account).grid(row=9, column=0, columnspan=2, pady=8)
+        self.su_btn = ttk.Button(f, text='Create Account', command=self._create_account)
+        self.su_btn.grid(row=9, column=0, columnspan=2, pady=8)
 
     def _create_account(self):
         username = self.su_user.get().strip()
@@ -313,7 +593,7 @@ class FitnessApp:
         sec_q = self.su_sec_q.get().strip() or None
         sec_a = self.su_sec_a.get()
 
-        if not username or not password:
+        if (len(username) == 0) | (len(password) == 0):
             messagebox.showerror('Error', 'Username and password required')
             return
 
@@ -321,21 +601,37 @@ class FitnessApp:
             messagebox.showerror('Error', 'Username already exists')
             return
 
-        salt = make_salt()
-        password_hash = hash_password(password, salt)
-
-        sec_a_hash = None
-        if sec_a:
-            sa_salt = make_salt()
-            sec_a_hash = hash_password(sec_a, sa_salt)
-
-        self.db.create_user(username, password_hash, age=int(age) if age else None,
-                            height=float(height) if height else None,
-                            weight=float(weight) if weight else None,
-                            security_q=sec_q, security_a_hash=sec_a_hash)
-
-        messagebox.showinfo('Success', 'Account created. Please login.')
-        self.signup_win.destroy()
+        # disable until the future resolves, mirroring login: a second click
+        # would pass the existence check again and double-insert the username
+        self.su_btn.config(state='disabled')
+
+        def finish(hashes):
+            self.su_btn.config(state='normal')
+            password_hash, sec_a_hash = hashes
+            self.db.create_user(username, password_hash, age=int(age) if age else None,
+                                height=float(height) if height else None,
+                                weight=float(weight) if weight else None,
+                                security_q=sec_q, security_a_hash=sec_a_hash)
+            messagebox.showinfo('Success', 'Account created. Please login.')
+            self.signup_win.withdraw()
+
+        self._submit_bg(self._hash_credentials, (password, sec_a), finish)
+
+    @staticmethod
+    def _hash_credentials(password, sec_a):
+        password_hash = hash_password(password, make_salt())
+        sec_a_hash = hash_password(sec_a, make_salt()) if sec_a else None
+        return password_hash, sec_a_hash
+
+    def _submit_bg(self, fn, args, on_done):
+        fut = self._pool.submit(fn, *args)
+        self._poll_future(fut, on_done)
+
+    def _poll_future(self, fut, on_done):
+        if fut.done():
+            on_done(fut.result())
+        else:
+            self.master.after(30, self._poll_future, fut, on_done)
 
     def _forgot_password(self):
         username = simpledialog.askstring('Forgot Password', 'Enter your username:', parent=self.master)
@@ -351,31 +647,55 @@ class FitnessApp:
         answer = simpledialog.askstring('Security Question', user['security_q'], parent=self.master)
         if not answer:
             return
-        if verify_password(user['security_a_hash'], answer):
+        def on_verified(ok):
+            if not ok:
+                messagebox.showerror('Error', 'Security answer did not match')
+                return
             newpw = simpledialog.askstring('Reset Password', 'Enter new password:', parent=self.master)
             if newpw:
-                salt = make_salt()
-                ph = hash_password(newpw, salt)
-                self.db.set_password(username, ph)
-                messagebox.showinfo('Success', 'Password reset. Please login with new password.')
-        else:
-            messagebox.showerror('Error', 'Security answer did not match')
+                def on_hashed(ph):
+                    self.db.set_password(username, ph)
+                    messagebox.showinfo('Success', 'Password reset. Please login with new password.')
+                self._submit_bg(hash_password, (newpw, make_salt()), on_hashed)
+
+        self._submit_bg(verify_password, (user['security_a_hash'], answer), on_verified)
 
     def login(self):
         username = self.login_user.get().strip()
         password = self.login_pass.get()
+        # single non-short-circuit test on both lengths; also skips the DB
+        # lookup entirely for blank submissions
+        if (len(username) == 0) | (len(password) == 0):
+            messagebox.showerror('Error', 'Username and password required')
+            return
         user = self.db.get_user(username)
         if not user:
             messagebox.showerror('Error', 'User not found')
             return
-        if verify_password(user['password_hash'], password):
-            self.current_user = username
-            self.user_row = user
-            self._build_main()
-        else:
-            messagebox.showerror('Error', 'Password incorrect')
+        self.login_btn.config(state='disabled')
+
+        def finish(ok):
+            self.login_btn.config(state='normal')
+            if ok:
+                self.current_user = username
+                self.user_row = user
+                # cache the goals row once per session; writes refresh it
+                # in-memory so UI refreshes stop roundtripping to SQLite
+                g = self.db.get_goals(username)
+                self._goals_cache = dict(g) if g else None
+                # transparently upgrade legacy PBKDF2 hashes to Argon2id
+                # while we still have the cleartext in hand
+                if needs_rehash(user['password_hash']):
+                    self._submit_bg(hash_password, (password, make_salt()),
+                                    lambda nh: self.db.set_password(username, nh))
+                self._build_main()
+            else:
+                messagebox.showerror('Error', 'Password incorrect')
+
+        self._submit_bg(verify_password, (user['password_hash'], password), finish)
 
     def _build_main(self):
+        _ensure_matplotlib()
         for widget in self.master.winfo_children():
             widget.destroy()
 
@@ -386,9 +706,10 @@ class FitnessApp:
         top_frame = ttk.Frame(container)
         top_frame.pack(fill='x')
 
-        ttk.Label(top_frame, text=f'Hello, {self.current_user}', font=('Helvetica', 14)).pack(side='left', padx=10, pady=8)
+        ttk.Label(top_frame, text=f'Hello, {self.current_user}', font=self.font_header).pack(side='left', padx=10, pady=8)
         ttk.Button(top_frame, text='Logout', command=self.logout).pack(side='right', padx=10)
-        ttk.Button(top_frame, text='Export Report', command=self.export_report).pack(side='right')
+        self.export_btn = ttk.Button(top_frame, text='Export Report', command=self.export_report)
+        self.export_btn.pack(side='right')
 
         main_pane = ttk.Panedwindow(container, orient='horizontal')
         main_pane.pack(fill='both', expand=True, padx=10, pady=10)
@@ -396,54 +717,39 @@ class FitnessApp:
         left = ttk.Frame(main_pane, width=320)
         main_pane.add(left, weight=1)
 
-        ttk.Label(left, text='Quick Entry', font=('Helvetica', 12, 'bold')).pack(pady=(0,6))
+        ttk.Label(left, text='Quick Entry', font=self.font_section).pack(pady=(0,6))
         form = ttk.Frame(left)
         form.pack()
 
-        ttk.Label(form, text='Date (YYYY-MM-DD):').grid(row=0, column=0, sticky='e')
-        self.entry_date = ttk.Entry(form)
-        self.entry_date.grid(row=0, column=1)
+        # reject non-numeric keystrokes at input time so submission never has
+        # to recover from malformed text via exceptions
+        num_vcmd = (self.master.register(_is_numeric_prefix), '%P')
+
+        numeric = {'validate': 'key', 'validatecommand': num_vcmd}
+        (self.entry_date, self.entry_sleep, self.entry_weight,
+         self.entry_cal, self.entry_steps) = self._labeled_entries(form, [
+            ('Date (YYYY-MM-DD):', {}),
+            ('Sleep (hrs):', numeric),
+            ('Weight (kg):', numeric),
+            ('Calories Burnt:', numeric),
+            ('Steps:', numeric),
+        ])
         self.entry_date.insert(0, datetime.date.today().isoformat())
 
-        ttk.Label(form, text='Sleep (hrs):').grid(row=1, column=0, sticky='e')
-        self.entry_sleep = ttk.Entry(form)
-        self.entry_sleep.grid(row=1, column=1)
-
-        ttk.Label(form, text='Weight (kg):').grid(row=2, column=0, sticky='e')
-        self.entry_weight = ttk.Entry(form)
-        self.entry_weight.grid(row=2, column=1)
-
-        ttk.Label(form, text='Calories Burnt:').grid(row=3, column=0, sticky='e')
-        self.entry_cal = ttk.Entry(form)
-        self.entry_cal.grid(row=3, column=1)
-
-        ttk.Label(form, text='Steps:').grid(row=4, column=0, sticky='e')
-        self.entry_steps = ttk.Entry(form)
-        self.entry_steps.grid(row=4, column=1)
-
         ttk.Button(form, text='Add Entry', command=self.add_entry).grid(row=5, column=0, columnspan=2, pady=8)
 
         ttk.Separator(left, orient='horizontal').pack(fill='x', pady=8)
 
-        ttk.Label(left, text='Goals', font=('Helvetica', 12, 'bold')).pack()
+        ttk.Label(left, text='Goals', font=self.font_section).pack()
         gframe = ttk.Frame(left)
         gframe.pack(pady=6)
 
-        ttk.Label(gframe, text='Weight Goal (kg):').grid(row=0, column=0, sticky='e')
-        self.goal_weight = ttk.Entry(gframe)
-        self.goal_weight.grid(row=0, column=1)
-
-        ttk.Label(gframe, text='Steps Goal:').grid(row=1, column=0, sticky='e')
-        self.goal_steps = ttk.Entry(gframe)
-        self.goal_steps.grid(row=1, column=1)
-
-        ttk.Label(gframe, text='Calories Goal:').grid(row=2, column=0, sticky='e')
-        self.goal_cal = ttk.Entry(gframe)
-        self.goal_cal.grid(row=2, column=1)
-
-        ttk.Label(gframe, text='Sleep Goal (hrs):').grid(row=3, column=0, sticky='e')
-        self.goal_sleep = ttk.Entry(gframe)
-        self.goal_sleep.grid(row=3, column=1)
+        self.goal_weight, self.goal_steps, self.goal_cal, self.goal_sleep = self._labeled_entries(gframe, [
+            ('Weight Goal (kg):', numeric),
+            ('Steps Goal:', numeric),
+            ('Calories Goal:', numeric),
+            ('Sleep Goal (hrs):', numeric),
+        ])
 
         ttk.Button(gframe, text='Save Goals', command=self.save_goals).grid(row=4, column=0, columnspan=2, pady=6)
 
@@ -461,6 +767,10 @@ class FitnessApp:
         self.nb.add(self.tab_insights, text='Insights')
         self.nb.add(self.tab_history, text='History')
 
+        self._dash_key = None
+        # report figures are preallocated once and cleared between exports
+        # instead of constructing four fresh Figure objects per report
+        self._report_figs = [Figure(figsize=(8,3)) for _ in range(4)]
         self.fig = Figure(figsize=(6,5), dpi=100)
         self.ax_sleep = self.fig.add_subplot(221)
         self.ax_weight = self.fig.add_subplot(222)
@@ -489,6 +799,8 @@ class FitnessApp:
 
     def logout(self):
         self.current_user = None
+        self.user_row = None
+        self._goals_cache = None
         self._build_login()
 
     def add_entry(self):
@@ -499,52 +811,32 @@ class FitnessApp:
             messagebox.showerror('Error', 'Invalid date format. Use YYYY-MM-DD')
             return
 
-        try:
-            sleep = float(self.entry_sleep.get() or 0)
-        except:
-            sleep = None
-        try:
-            weight = float(self.entry_weight.get() or 0)
-        except:
-            weight = None
-        try:
-            calories = float(self.entry_cal.get() or 0)
-        except:
-            calories = None
-        try:
-            steps = int(self.entry_steps.get() or 0)
-        except:
-            steps = None
+        sleep = _to_float(self.entry_sleep.get() or 0)
+        weight = _to_float(self.entry_weight.get() or 0)
+        calories = _to_float(self.entry_cal.get() or 0)
+        steps = _to_int(self.entry_steps.get() or 0)
 
-        self.db.add_daily(self.current_user, date_str, sleep, weight, calories, steps)
+        with self.db.txn():
+            self.db.add_daily(self.current_user, date_str, sleep, weight, calories, steps)
         messagebox.showinfo('Saved', 'Entry added')
         self.refresh_dashboard()
         self.refresh_insights()
         self.refresh_history()
 
     def save_goals(self):
-        try:
-            wg = float(self.goal_weight.get()) if self.goal_weight.get().strip() else None
-        except:
-            wg = None
-        try:
-            sg = int(self.goal_steps.get()) if self.goal_steps.get().strip() else None
-        except:
-            sg = None
-        try:
-            cg = float(self.goal_cal.get()) if self.goal_cal.get().strip() else None
-        except:
-            cg = None
-        try:
-            sl = float(self.goal_sleep.get()) if self.goal_sleep.get().strip() else None
-        except:
-            sl = None
-        self.db.upsert_goals(self.current_user, wg, sg, cg, sl)
+        wg = _to_float(self.goal_weight.get().strip() or None)
+        sg = _to_int(self.goal_steps.get().strip() or None)
+        cg = _to_float(self.goal_cal.get().strip() or None)
+        sl = _to_float(self.goal_sleep.get().strip() or None)
+        with self.db.txn():
+            self.db.upsert_goals(self.current_user, wg, sg, cg, sl)
+        self._goals_cache = {'username': self.current_user, 'weight_goal': wg, 'steps_goal': sg,
+                             'calories_goal': cg, 'sleep_goal': sl}
         messagebox.showinfo('Saved', 'Goals saved')
         self.refresh_insights()
 
     def _load_goals(self):
-        g = self.db.get_goals(self.current_user)
+        g = self._goals_cache
         if g:
             self.goal_weight.delete(0, 'end'); self.goal_steps.delete(0, 'end'); self.goal_cal.delete(0, 'end'); self.goal_sleep.delete(0, 'end')
             if g['weight_goal'] is not None:
@@ -559,45 +851,56 @@ class FitnessApp:
     # ---------------- Dashboard / Plots ----------------
     def _make_series(self):
         rows = self.db.get_last_n_days(self.current_user, n=90)
-        dates = [datetime.date.fromisoformat(r['date']) for r in rows]
-        sleep = [r['sleep_hrs'] if r['sleep_hrs'] is not None else float('nan') for r in rows]
-        weight = [r['weight'] if r['weight'] is not None else float('nan') for r in rows]
-        calories = [r['calories'] if r['calories'] is not None else float('nan') for r in rows]
-        steps = [r['steps'] if r['steps'] is not None else float('nan') for r in rows]
-        return dates, sleep, weight, calories, steps
+        if not rows:
+            empty = np.array([], dtype=np.float64)
+            return [], empty, empty, empty, empty
+        # dates stay as the stored ISO strings — the axes plot them verbatim,
+        # so parsing to date objects and re-formatting was a pointless round trip.
+        # One zip transpose replaces four per-column row scans, and the float64
+        # conversion maps None to nan for free.
+        dates, sleep, weight, calories, steps = zip(*rows)
+        return (list(dates), np.array(sleep, dtype=np.float64), np.array(weight, dtype=np.float64),
+                np.array(calories, dtype=np.float64), np.array(steps, dtype=np.float64))
 
     def refresh_dashboard(self):
+        # skip the matplotlib redraw entirely when nothing changed since the
+        # last draw — the render is by far the slowest part of this path
+        key = (self.current_user,) + self.db.daily_stat(self.current_user)
+        if key == self._dash_key:
+            return
+        self._dash_key = key
+
         dates, sleep, weight, calories, steps = self._make_series()
-        self.ax_sleep.clear(); self.ax_weight.clear(); self.ax_cal.clear(); self.ax_steps.clear()
+        series = ((self.ax_sleep, 'Sleep (hrs)', sleep), (self.ax_weight, 'Weight (kg)', weight),
+                  (self.ax_cal, 'Calories Burnt', calories), (self.ax_steps, 'Steps', steps))
 
         if dates:
-            x = [d.isoformat() for d in dates]
-            # Sleep
-            self.ax_sleep.plot(x, sleep, marker='o')
-            self.ax_sleep.set_title('Sleep (hrs)')
-            self.ax_sleep.tick_params(axis='x', rotation=45)
-
-            # Weight
-            self.ax_weight.plot(x, weight, marker='o')
-            self.ax_weight.set_title('Weight (kg)')
-            self.ax_weight.tick_params(axis='x', rotation=45)
-
-            # Calories
-            self.ax_cal.plot(x, calories, marker='o')
-            self.ax_cal.set_title('Calories Burnt')
-            self.ax_cal.tick_params(axis='x', rotation=45)
-
-            # Steps
-            self.ax_steps.plot(x, steps, marker='o')
-            self.ax_steps.set_title('Steps')
-            self.ax_steps.tick_params(axis='x', rotation=45)
-
+            # per-point markers get expensive on dense series; drop them
+            # once the window holds more than 60 points
+            marker = 'o' if len(dates) <= 60 else None
+            for ax, title, ys in series:
+                if ax.lines:
+                    # mutate the existing Line2D instead of tearing down and
+                    # rebuilding the axis artist tree on every refresh
+                    line = ax.lines[0]
+                    line.set_data(dates, ys)
+                    line.set_marker(marker if marker else 'None')
+                    ax.relim()
+                    ax.autoscale_view()
+                else:
+                    ax.clear()
+                    ax.plot(dates, ys, marker=marker)
+                    ax.set_title(title)
+                    ax.tick_params(axis='x', rotation=45)
         else:
-            for ax in (self.ax_sleep, self.ax_weight, self.ax_cal, self.ax_steps):
+            for ax, _, _ in series:
+                ax.clear()
                 ax.text(0.5, 0.5, 'No data', ha='center')
 
         self.fig.tight_layout()
-        self.canvas.draw()
+        # draw_idle coalesces with Tk's event loop instead of forcing a
+        # synchronous render in the middle of the callback
+        self.canvas.draw_idle()
 
     def refresh_insights(self):
         rows = self.db.get_last_n_days(self.current_user, n=30)
@@ -606,20 +909,18 @@ class FitnessApp:
             text.append('No data to analyze')
             self.insight_text.delete('1.0', 'end'); self.insight_text.insert('1.0', '\n'.join(text)); return
 
-        # compute averages and trends
-        def numeric_avg(arr):
-            s = [float(x) for x in arr if x is not None]
-            return sum(s)/len(s) if s else None
+        # compute averages and trends; None becomes nan so the reductions
+        # run vectorized instead of per-element Python loops
+        arr = np.array([[r['sleep_hrs'], r['weight'], r['calories'], r['steps']] for r in rows], dtype=np.float64)
 
-        sleeps = [r['sleep_hrs'] for r in rows]
-        weights = [r['weight'] for r in rows]
-        cals = [r['calories'] for r in rows]
-        steps = [r['steps'] for r in rows]
+        def nan_avg(col):
+            col = col[~np.isnan(col)]
+            return float(col.mean()) if col.size else None
 
-        avg_sleep = numeric_avg(sleeps)
-        avg_weight = numeric_avg(weights)
-        avg_cal = numeric_avg(cals)
-        avg_steps = numeric_avg(steps)
+        avg_sleep = nan_avg(arr[:, 0])
+        avg_weight = nan_avg(arr[:, 1])
+        avg_cal = nan_avg(arr[:, 2])
+        avg_steps = nan_avg(arr[:, 3])
 
         text.append(f'In the last {len(rows)} days:')
         if avg_sleep: text.append(f'- Average sleep: {avg_sleep:.2f} hrs')
@@ -628,7 +929,7 @@ class FitnessApp:
         if avg_steps: text.append(f'- Average steps: {avg_steps:.0f}')
 
         # Goal progress
-        g = self.db.get_goals(self.current_user)
+        g = self._goals_cache
         if g:
             if g['weight_goal'] and avg_weight:
                 diff = avg_weight - g['weight_goal']
@@ -647,71 +948,69 @@ class FitnessApp:
                     text.append(f"- Sleep goal attainment (avg/day): {pct:.1f}%")
 
         try:
-            ws = [w for w in weights if w is not None]
-            if len(ws) >= 3:
-                xs = list(range(len(ws)))
-                mean_x = sum(xs)/len(xs)
-                mean_y = sum(ws)/len(ws)
-                num = sum((xi-mean_x)*(yi-mean_y) for xi, yi in zip(xs, ws))
-                den = sum((xi-mean_x)**2 for xi in xs)
-                slope = num/den if den else 0
+            ws = arr[:, 1]
+            ws = ws[~np.isnan(ws)]
+            if ws.size >= 3:
+                slope = float(_slope(ws))
                 text.append(f"- Weight trend: slope {slope:.3f} kg/day ({'losing' if slope<0 else 'gaining' if slope>0 else 'stable'})")
         except Exception:
             pass
 
         # BMI and BMR
-        u = self.db.get_user(self.current_user)
+        u = self.user_row
         if u and u['height_cm'] and u['weight_kg'] and u['age']:
             bmi = calc_bmi(u['weight_kg'], u['height_cm'])
             bmr = calc_bmr(u['weight_kg'], u['height_cm'], u['age'])
             text.append(f"- BMI: {bmi} ({bmi_category(bmi)})")
             text.append(f"- Estimated BMR: {bmr} kcal/day")
+            ws = arr[:, 1]
+            ws = ws[~np.isnan(ws)]
+            if ws.size:
+                bmis = calc_bmi_vec(ws, u['height_cm'])
+                cats = bmi_cat_vec(bmis)
+                text.append(f"- BMI over window: {bmis.min():.1f} to {bmis.max():.1f} (latest: {cats[-1]})")
 
         self.insight_text.delete('1.0', 'end')
         self.insight_text.insert('1.0', '\n'.join(text))
 
     
     def refresh_history(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        self.tree.delete(*self.tree.get_children())
         rows = self.db.get_last_n_days(self.current_user, n=365)
-        for r in rows:
-            self.tree.insert('', 'end', values=(r['date'], r['sleep_hrs'], r['weight'], r['calories'], r['steps']))
+        # build all value tuples up front so the insert loop does no keyed
+        # Row lookups, and bind the insert method once outside the loop
+        vals_iter = iter([(r['date'], r['sleep_hrs'], r['weight'], r['calories'], r['steps']) for r in rows])
+        insert = self.tree.insert
+        # bump the generation so a refresh triggered mid-fill cancels the
+        # previous fill instead of interleaving stale rows
+        self._hist_gen = getattr(self, '_hist_gen', 0) + 1
+        gen = self._hist_gen
+
+        def push():
+            if gen != self._hist_gen:
+                return
+            batch = list(islice(vals_iter, 50))
+            for v in batch:
+                insert('', 'end', values=v)
+            if batch:
+                self.master.after_idle(push)
+
+        self.master.after_idle(push)
 
     
     def _gather_figures_for_report(self):
-        
         dates, sleep, weight, calories, steps = self._make_series()
         figs = []
         if dates:
-            # Sleep
-            f1 = Figure(figsize=(8,3))
-            ax = f1.add_subplot(111)
-            ax.plot([d.isoformat() for d in dates], sleep, marker='o')
-            ax.set_title('Sleep (hrs)')
-            ax.tick_params(axis='x', rotation=45)
-            figs.append(f1)
-
-            f2 = Figure(figsize=(8,3))
-            ax = f2.add_subplot(111)
-            ax.plot([d.isoformat() for d in dates], weight, marker='o')
-            ax.set_title('Weight (kg)')
-            ax.tick_params(axis='x', rotation=45)
-            figs.append(f2)
-
-            f3 = Figure(figsize=(8,3))
-            ax = f3.add_subplot(111)
-            ax.plot([d.isoformat() for d in dates], calories, marker='o')
-            ax.set_title('Calories Burnt')
-            ax.tick_params(axis='x', rotation=45)
-            figs.append(f3)
-
-            f4 = Figure(figsize=(8,3))
-            ax = f4.add_subplot(111)
-            ax.plot([d.isoformat() for d in dates], steps, marker='o')
-            ax.set_title('Steps')
-            ax.tick_params(axis='x', rotation=45)
-            figs.append(f4)
+            series = [('Sleep (hrs)', sleep), ('Weight (kg)', weight),
+                      ('Calories Burnt', calories), ('Steps', steps)]
+            for fig, (title, ys) in zip(self._report_figs, series):
+                fig.clear()
+                ax = fig.add_subplot(111)
+                ax.plot(dates, ys, marker='o')
+                ax.set_title(title)
+                ax.tick_params(axis='x', rotation=45)
+                figs.append(fig)
         return figs
 
     def export_report(self):
@@ -734,12 +1033,26 @@ class FitnessApp:
         if avg(cals): summary['Average calories'] = f"{avg(cals):.1f}"
         if avg(steps): summary['Average steps/day'] = f"{avg(steps):.0f}"
 
-        user_row = self.db.get_user(self.current_user)
-        filename = export_report_pdf(self.current_user, user_row, summary, figs)
-        if filename:
-            messagebox.showinfo('Exported', f'Report saved: {filename}')
-        else:
-            messagebox.showerror('Error', 'Failed to export report. Is fpdf installed?')
+        # figure rasterization and the PDF write are the slow part; they only
+        # touch plain (non-Tk) Figure objects, so run them in the worker pool.
+        # Disable the button meanwhile: a second click would clear and replot
+        # the shared report figures the worker is still rendering.
+        self.export_btn.config(state='disabled')
+
+        def run_export():
+            try:
+                return export_report_pdf(self.current_user, self.user_row, summary, figs)
+            except Exception:
+                return None
+
+        def finish(filename):
+            self.export_btn.config(state='normal')
+            if filename:
+                messagebox.showinfo('Exported', f'Report saved: {filename}')
+            else:
+                messagebox.showerror('Error', 'Failed to export report. Is fpdf installed?')
+
+        self._submit_bg(run_export, (), finish)
 
 
 def main():